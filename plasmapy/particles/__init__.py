@@ -2,8 +2,62 @@
 The `plasmapy.particles` subpackage provides access to information about
 atoms, isotopes, ions, and other particles.
 """
-# __all__ will be auto populated below
-__all__ = []
+# The names below are sorted; test_init.py checks that this listing
+# stays consistent with the module namespace.
+__all__ = (
+    "AbstractParticle",
+    "CustomParticle",
+    "DimensionlessParticle",
+    "IonizationState",
+    "IonizationStates",
+    "Particle",
+    "ParticleJSONDecoder",
+    "ParticleZoo",
+    "State",
+    "alpha",
+    "atomic",
+    "atomic_number",
+    "atomic_symbol",
+    "common_isotopes",
+    "decorators",
+    "deuteron",
+    "electric_charge",
+    "electron",
+    "element_name",
+    "elements",
+    "exceptions",
+    "half_life",
+    "integer_charge",
+    "ionic_symbol",
+    "ionization_state",
+    "ionization_states",
+    "is_stable",
+    "isotope_symbol",
+    "isotopes",
+    "isotopic_abundance",
+    "json_load_particle",
+    "json_loads_particle",
+    "known_isotopes",
+    "mass_number",
+    "neutron",
+    "nuclear",
+    "nuclear_binding_energy",
+    "nuclear_reaction_energy",
+    "parsing",
+    "particle_class",
+    "particle_input",
+    "particle_mass",
+    "particle_symbol",
+    "positron",
+    "proton",
+    "reduced_mass",
+    "serialization",
+    "special_particles",
+    "stable_isotopes",
+    "standard_atomic_weight",
+    "symbols",
+    "triton",
+)
 
 from plasmapy.particles.atomic import (
     atomic_number,
@@ -44,31 +98,28 @@ from plasmapy.particles.symbols import (
     particle_symbol,
 )
 
-# Create instances of the most commonly used particles
-
-#: PlasmaPy particle object for a proton
-proton = Particle("p+")
-
-#: PlasmaPy particle object for an electron
-electron = Particle("e-")
-
-#: PlasmaPy particle object for a neutron
-neutron = Particle("n")
-
-#: PlasmaPy particle object for a positron
-positron = Particle("e+")
+# Symbols for the Particle objects of the most commonly used particles.
+# The objects themselves are created lazily (PEP 562) on first attribute
+# access so that `import plasmapy.particles` does not pay for seven
+# Particle constructions up front.
+_special_particle_symbols = {
+    "proton": "p+",
+    "electron": "e-",
+    "neutron": "n",
+    "positron": "e+",
+    "deuteron": "D 1+",
+    "triton": "T 1+",
+    "alpha": "He-4 2+",
+}
 
-#: PlasmaPy particle object for a deuteron
-deuteron = Particle("D 1+")
 
-#: PlasmaPy particle object for a triton
-triton = Particle("T 1+")
+def __getattr__(name):
+    """Create the commonly used Particle instances on first access."""
+    if name in _special_particle_symbols:
+        return Particle._from_builtin(_special_particle_symbols[name])
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-#: PlasmaPy particle object for an alpha particle
-alpha = Particle("He-4 2+")
 
-# auto populate __all__
-for obj_name in list(globals()):
-    if not (obj_name.startswith("__") or obj_name.endswith("__")):
-        __all__.append(obj_name)
-__all__.sort()
+def __dir__():
+    """Include the lazily created particles for tab-completion."""
+    return sorted(set(globals()) | set(_special_particle_symbols))
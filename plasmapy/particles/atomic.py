@@ -1,22 +1,22 @@
 """Functions that retrieve or are related to elemental or isotopic data."""
 __all__ = [
     "atomic_number",
-    "mass_number",
-    "standard_atomic_weight",
-    "particle_mass",
-    "isotopic_abundance",
-    "integer_charge",
+    "common_isotopes",
     "electric_charge",
-    "is_stable",
     "half_life",
+    "integer_charge",
+    "is_stable",
+    "isotopic_abundance",
     "known_isotopes",
-    "common_isotopes",
-    "stable_isotopes",
-    "reduced_mass",
-    "periodic_table_period",
-    "periodic_table_group",
+    "mass_number",
+    "particle_mass",
     "periodic_table_block",
     "periodic_table_category",
+    "periodic_table_group",
+    "periodic_table_period",
+    "reduced_mass",
+    "stable_isotopes",
+    "standard_atomic_weight",
 ]
 
 import astropy.constants as const
@@ -33,12 +33,10 @@ from plasmapy.particles.exceptions import (
     InvalidParticleError,
     MissingAtomicDataError,
 )
-from plasmapy.particles.isotopes import _Isotopes
+from plasmapy.particles import isotopes as _isotopes
 from plasmapy.particles.particle_class import Particle
 from plasmapy.particles.symbols import atomic_symbol
 
-__all__.sort()
-
 
 @particle_input
 def atomic_number(element: Particle) -> Integral:
@@ -583,19 +581,8 @@ def known_isotopes(argument: Union[str, Integral] = None) -> List[str]:
 
     def known_isotopes_for_element(argument):
         element = atomic_symbol(argument)
-        isotopes = []
-        for isotope in _Isotopes.keys():
-            if element + "-" in isotope and isotope[0 : len(element)] == element:
-                isotopes.append(isotope)
-        if element == "H":
-            isotopes.insert(1, "D")
-            isotopes.insert(2, "T")
-        mass_numbers = [mass_number(isotope) for isotope in isotopes]
-        sorted_isotopes = [
-            mass_number
-            for (isotope, mass_number) in sorted(zip(mass_numbers, isotopes))
-        ]
-        return sorted_isotopes
+        known = _isotopes._get_isotope_groupings()["known"]
+        return list(known.get(atomic_number(element), ()))
 
     if argument is not None:
         try:
@@ -695,22 +682,8 @@ def common_isotopes(
         argument: Union[str, int], most_common_only: Optional[bool]
     ) -> List[str]:
 
-        isotopes = known_isotopes(argument)
-
-        CommonIsotopes = [
-            isotope for isotope in isotopes if "abundance" in _Isotopes[isotope].keys()
-        ]
-
-        isotopic_abundances = [
-            _Isotopes[isotope]["abundance"] for isotope in CommonIsotopes
-        ]
-
-        sorted_isotopes = [
-            iso_comp
-            for (isotope, iso_comp) in sorted(zip(isotopic_abundances, CommonIsotopes))
-        ]
-
-        sorted_isotopes.reverse()
+        common = _isotopes._get_isotope_groupings()["common"]
+        sorted_isotopes = list(common.get(atomic_number(atomic_symbol(argument)), ()))
 
         if most_common_only and len(sorted_isotopes) > 1:
             sorted_isotopes = sorted_isotopes[0:1]
@@ -815,13 +788,9 @@ def stable_isotopes(
     def stable_isotopes_for_element(
         argument: Union[str, int], stable_only: Optional[bool]
     ) -> List[str]:
-        KnownIsotopes = known_isotopes(argument)
-        StableIsotopes = [
-            isotope
-            for isotope in KnownIsotopes
-            if _Isotopes[isotope]["stable"] == stable_only
-        ]
-        return StableIsotopes
+        groupings = _isotopes._get_isotope_groupings()
+        listing = groupings["stable" if stable_only else "unstable"]
+        return list(listing.get(atomic_number(atomic_symbol(argument)), ()))
 
     if argument is not None:
         try:
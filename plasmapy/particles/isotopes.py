@@ -8,8 +8,27 @@ Module for loading isotope data from :file:`plasmapy/particles/data/isotopes.jso
 __all__ = []
 
 import astropy.units as u
-import json
-import pkgutil
+import collections
+import collections.abc
+import hashlib
+import numpy as np
+import pickle
+import pickletools
+import sys
+import types
+
+try:
+    from importlib.resources import files as _resource_files
+except ImportError:  # Python < 3.9
+    _resource_files = None
+    import pkgutil
+
+try:
+    # orjson parses the UTF-8 bytes of isotopes.json in compiled code,
+    # which is considerably faster than the pure-Python json module.
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
 
 # this code was used to create the JSON file as per vn-ki on Riot:
 # https://matrix.to/#/!hkWCiyhQyxiYJlUtKF:matrix.org/
@@ -24,16 +43,310 @@ import pkgutil
 # with open("isotopes.json", "w") as f:
 #     json.dump(_Isotopes, f, default=plasma_default, indent=2)
 
+# Format stamp for data/isotopes.pkl; bump when the stored layout changes.
+_PICKLE_FORMAT = 3
+
+
+def _read_data_bytes(filename: str) -> bytes:
+    """
+    Read a file from :file:`plasmapy/particles/data` as bytes.
+
+    `importlib.resources` is preferred over the legacy
+    `pkgutil.get_data` loader protocol, as it is faster and zip-safe;
+    the latter remains as a fallback for Python versions older than 3.9.
+    """
+    if _resource_files is not None:
+        return (
+            _resource_files("plasmapy.particles") / "data" / filename
+        ).read_bytes()
+    return pkgutil.get_data("plasmapy", f"particles/data/{filename}")
+
+
+# Cache of parsed units.  Only a handful of distinct unit strings occur
+# across the thousands of entries in isotopes.json, so each is parsed at
+# most once.  The units known to appear are prepopulated so the common
+# path never calls u.Unit() at all.
+_unit_cache = {"u": u.u, "s": u.s}
+
+
+def _lookup_unit(unit_str: str) -> u.UnitBase:
+    """Return the unit for ``unit_str``, parsing it at most once."""
+    unit = _unit_cache.get(unit_str)
+    if unit is None:
+        unit = _unit_cache[unit_str] = u.Unit(unit_str)
+    return unit
+
+
+class _IsotopeEntry(collections.abc.Mapping):
+    """
+    A mapping view of the data for a single isotope.
+
+    The underlying storage keeps the raw values from isotopes.json
+    (plain floats plus a unit string) rather than Quantities, so that
+    building the full table does not construct thousands of
+    `~astropy.units.Quantity` instances up front.  A Quantity is built
+    the first time a quantity-valued field is accessed and cached
+    thereafter.
+    """
+
+    __slots__ = ("_raw", "_quantities")
+
+    def __init__(self, raw: dict):
+        self._raw = raw
+        self._quantities = {}
+
+    def __getitem__(self, key):
+        value = self._raw[key]
+        if isinstance(value, dict):
+            quantity = self._quantities.get(key)
+            if quantity is None:
+                quantity = self._quantities[key] = value["value"] * _lookup_unit(
+                    value["unit"]
+                )
+            return quantity
+        return value
+
+    def __iter__(self):
+        return iter(self._raw)
+
+    def __len__(self) -> int:
+        return len(self._raw)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self._raw!r})"
+
 
-def _isotope_obj_hook(obj):
-    """An `object_hook` designed for `json.load` and `json.loads`."""
-    if "unit" in obj:
-        return obj["value"] * u.Unit(obj["unit"])
-    return obj
+def _raw_value(symbol: str, field: str):
+    """
+    Return the unwrapped value of ``field`` for the isotope with the
+    given symbol, without constructing a Quantity, or `None` if the
+    field is absent.  Intended for numeric hot paths that apply a single
+    unit conversion at the end instead of carrying units through the
+    arithmetic.
+    """
+    isotopes = globals().get("_Isotopes")
+    if isotopes is None:
+        isotopes = __getattr__("_Isotopes")
+    value = isotopes[symbol]._raw.get(field)
+    if isinstance(value, dict):
+        return value["value"]
+    return value
 
 
-#: Dictionary of isotope data.
-_Isotopes = json.loads(
-    pkgutil.get_data("plasmapy", "particles/data/isotopes.json"),
-    object_hook=_isotope_obj_hook,
+#: Struct-of-arrays view of the isotope table, indexed by
+#: ``[atomic number, mass number]``.
+_IsotopeArrays = collections.namedtuple(
+    "_IsotopeArrays", ["mass", "abundance", "stable", "symbol"]
 )
+
+
+def _get_isotope_arrays() -> _IsotopeArrays:
+    """
+    Return a struct-of-arrays view of the isotope table, built lazily on
+    first use.
+
+    Each array is indexed by ``[atomic number, mass number]``.  The
+    ``mass`` and ``abundance`` arrays hold floats (`~numpy.nan` where no
+    such isotope exists or the field is absent), ``stable`` is a boolean
+    mask, and ``symbol`` is an object array of isotope symbols (`None`
+    where absent).  This layout allows bulk queries — such as collecting
+    every known isotope of an element — to index a contiguous row
+    instead of scanning the per-isotope dictionaries.
+    """
+    arrays = globals().get("_isotope_arrays")
+    if arrays is None:
+        isotopes = globals().get("_Isotopes")
+        if isotopes is None:
+            isotopes = __getattr__("_Isotopes")
+        max_z = 0
+        max_a = 0
+        for entry in isotopes.values():
+            raw = entry._raw
+            max_z = max(max_z, raw["atomic number"])
+            max_a = max(max_a, raw["mass number"])
+        shape = (max_z + 1, max_a + 1)
+        mass = np.full(shape, np.nan)
+        abundance = np.full(shape, np.nan)
+        stable = np.zeros(shape, dtype=bool)
+        symbol = np.full(shape, None, dtype=object)
+        for sym, entry in isotopes.items():
+            raw = entry._raw
+            z = raw["atomic number"]
+            a = raw["mass number"]
+            mass[z, a] = raw["mass"]["value"]
+            if "abundance" in raw:
+                abundance[z, a] = raw["abundance"]
+            stable[z, a] = raw["stable"]
+            symbol[z, a] = sym
+        arrays = globals()["_isotope_arrays"] = _IsotopeArrays(
+            mass=mass, abundance=abundance, stable=stable, symbol=symbol
+        )
+    return arrays
+
+
+def _get_isotope_groupings() -> dict:
+    """
+    Return per-element isotope listings, built lazily on first use.
+
+    The result maps ``"known"``, ``"common"``, ``"stable"``, and
+    ``"unstable"`` to dictionaries keyed by atomic number whose values
+    are tuples of isotope symbols.  The ``"known"``, ``"stable"``, and
+    ``"unstable"`` listings are ordered by mass number; ``"common"`` is
+    ordered from most to least abundant.  Having these precomputed turns
+    the per-call filtering in `~plasmapy.particles.known_isotopes` and
+    friends into a single dictionary lookup.
+    """
+    groupings = globals().get("_isotope_groupings")
+    if groupings is None:
+        arrays = _get_isotope_arrays()
+        known = {}
+        common = {}
+        stable = {}
+        unstable = {}
+        for z in range(1, arrays.symbol.shape[0]):
+            symbol_row = arrays.symbol[z]
+            present = [a for a, sym in enumerate(symbol_row) if sym is not None]
+            if not present:
+                continue
+            known[z] = tuple(symbol_row[a] for a in present)
+            with_abundance = sorted(
+                (
+                    (arrays.abundance[z, a], symbol_row[a])
+                    for a in present
+                    if not np.isnan(arrays.abundance[z, a])
+                ),
+                reverse=True,
+            )
+            common[z] = tuple(sym for _, sym in with_abundance)
+            stable[z] = tuple(symbol_row[a] for a in present if arrays.stable[z, a])
+            unstable[z] = tuple(
+                symbol_row[a] for a in present if not arrays.stable[z, a]
+            )
+        groupings = globals()["_isotope_groupings"] = {
+            "known": known,
+            "common": common,
+            "stable": stable,
+            "unstable": unstable,
+        }
+    return groupings
+
+
+def _load_raw_isotopes() -> dict:
+    """
+    Load the raw isotope data, preferring :file:`data/isotopes.pkl` over
+    :file:`data/isotopes.json`.
+
+    The pickle stores the already-parsed tree of builtin objects, so
+    loading it skips the JSON parse.  It carries a format stamp and a
+    digest of the isotopes.json it was generated from, and is ignored
+    (falling back to parsing the JSON file) if either does not match,
+    so a pickle that has gone stale relative to isotopes.json cannot
+    silently ship outdated data.
+    """
+    json_bytes = _read_data_bytes("isotopes.json")
+    try:
+        pickled = _read_data_bytes("isotopes.pkl")
+    except OSError:
+        pickled = None
+    if pickled is not None:
+        try:
+            payload = pickle.loads(pickled)
+            if (
+                payload.get("format") == _PICKLE_FORMAT
+                and payload.get("json_digest") == hashlib.md5(json_bytes).hexdigest()
+            ):
+                return payload["isotopes"]
+        except Exception:
+            pass
+    return _json_loads(json_bytes)
+
+
+def _validate_raw_isotopes(raw_isotopes: dict):
+    """
+    Check that the parsed isotopes.json tree has the expected shape.
+
+    The runtime loaders trust the data unconditionally — no per-node
+    schema checks happen on import — so this validation runs once, when
+    the pickle is (re)generated, and raises a `ValueError` describing
+    the first malformed entry found.
+    """
+    from numbers import Real
+
+    for symbol, entry in raw_isotopes.items():
+        if not isinstance(entry, dict):
+            raise ValueError(f"The entry for {symbol!r} is not a dict.")
+        for field in ("atomic number", "mass number"):
+            if not isinstance(entry.get(field), int):
+                raise ValueError(
+                    f"The {field!r} of {symbol!r} is not an integer."
+                )
+        if not isinstance(entry.get("stable"), bool):
+            raise ValueError(f"The 'stable' field of {symbol!r} is not a bool.")
+        for field, value in entry.items():
+            if isinstance(value, dict):
+                if set(value) != {"unit", "value"}:
+                    raise ValueError(
+                        f"The {field!r} of {symbol!r} has keys "
+                        f"{set(value)} instead of {{'unit', 'value'}}."
+                    )
+                if not isinstance(value["unit"], str) or not isinstance(
+                    value["value"], Real
+                ):
+                    raise ValueError(
+                        f"The {field!r} of {symbol!r} does not hold a "
+                        f"unit string and a real number."
+                    )
+
+
+def _generate_isotopes_pickle():
+    """
+    Regenerate :file:`data/isotopes.pkl` from :file:`data/isotopes.json`.
+
+    This should be rerun (and the result committed) whenever
+    isotopes.json changes or the stored layout is revised.
+    """
+    import os
+
+    json_bytes = _read_data_bytes("isotopes.json")
+    isotopes = _json_loads(json_bytes)
+    _validate_raw_isotopes(isotopes)
+    payload = pickle.dumps(
+        {
+            "format": _PICKLE_FORMAT,
+            "json_digest": hashlib.md5(json_bytes).hexdigest(),
+            "isotopes": isotopes,
+        },
+        protocol=4,
+    )
+    path = os.path.join(os.path.dirname(__file__), "data", "isotopes.pkl")
+    with open(path, "wb") as file:
+        file.write(pickletools.optimize(payload))
+
+
+def __getattr__(name):
+    """
+    Build the isotope dictionary on first access (PEP 562) so that
+    importing this module does not pay the cost of loading the data.
+    """
+    if name == "_Isotopes":
+        # Intern the symbol and unit strings: parsing creates a fresh
+        # str object for every occurrence, whereas interning shares one
+        # copy per distinct string and lets dict lookups on these keys
+        # succeed on an identity comparison.
+        intern = sys.intern
+        entry = _IsotopeEntry
+        isotopes = {}
+        for symbol, raw in _load_raw_isotopes().items():
+            for field_value in raw.values():
+                if type(field_value) is dict:
+                    field_value["unit"] = intern(field_value["unit"])
+            isotopes[intern(symbol)] = entry(raw)
+        # Freeze the table: the entries are already read-only mappings,
+        # and a read-only view of the outer dict signals that callers
+        # may share it without defensive copies.
+        isotopes = types.MappingProxyType(isotopes)
+        # Stash the mapping in the module namespace so that subsequent
+        # attribute lookups bypass this function.
+        globals()["_Isotopes"] = isotopes
+        return isotopes
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -24,7 +24,7 @@ from plasmapy.particles.exceptions import (
     InvalidElementError,
     InvalidParticleError,
 )
-from plasmapy.particles.isotopes import _Isotopes
+from plasmapy.particles import isotopes as _isotopes
 from plasmapy.particles.special_particles import _Particles, ParticleZoo
 from plasmapy.utils import roman
 
@@ -331,7 +331,7 @@ def _parse_and_check_atomic_input(
             elif isotope == "H-3":
                 isotope = "T"
 
-            if isotope not in _Isotopes.keys():
+            if isotope not in _isotopes._Isotopes.keys():
                 raise InvalidParticleError(
                     f"The string '{isotope}' does not correspond to "
                     f"a valid isotope."
@@ -31,7 +31,7 @@ from plasmapy.particles.exceptions import (
     MissingAtomicDataError,
     MissingAtomicDataWarning,
 )
-from plasmapy.particles.isotopes import _Isotopes
+from plasmapy.particles import isotopes as _isotopes
 from plasmapy.particles.parsing import (
     _dealias_particle_aliases,
     _invalid_particle_errmsg,
@@ -368,6 +368,35 @@ class Particle(AbstractParticle):
     ``'transition metal'``, ``'uncharged'``, and ``'unstable'``.
     """
 
+    # Cache of parsed attributes and categories, keyed on the arguments
+    # to __init__.  Construction is deterministic, so repeated calls for
+    # the same particle can skip the parser and table lookups.
+    _construction_cache = {}
+
+    # Canonical symbols of the particle constants provided by
+    # plasmapy.particles, mapped to their shared instances by
+    # _from_builtin.
+    _builtin_instances = {}
+
+    @classmethod
+    def _from_builtin(cls, symbol: str):
+        """
+        Return a shared instance for one of the canonical symbols of the
+        package's built-in particle constants (e.g. ``"p+"`` for
+        `~plasmapy.particles.proton`).
+
+        The instance is constructed through the normal path exactly once
+        per symbol and reused afterwards, so every built-in constant and
+        internal caller resolves to the same object without re-running
+        the parser.  (Hardcoding the parsed attributes here instead was
+        rejected: the payloads are astropy Quantities derived from
+        CODATA constants and would inevitably drift from the parser.)
+        """
+        instance = cls._builtin_instances.get(symbol)
+        if instance is None:
+            instance = cls._builtin_instances[symbol] = cls(symbol)
+        return instance
+
     def __init__(
         self,
         argument: Union[str, Integral],
@@ -399,6 +428,43 @@ class Particle(AbstractParticle):
         if Z is not None and not isinstance(Z, Integral):
             raise TypeError("Z is not an integer.")
 
+        # Reuse previously parsed results where possible.  Each instance
+        # receives its own copies of the attributes and categories so
+        # that in-place methods such as `ionize` and `recombine` cannot
+        # alter the cached entries.  Constructions that issue warnings
+        # are not cached so that the warnings recur on every call.
+
+        cache_key = (argument, mass_numb, Z)
+        cached = Particle._construction_cache.get(cache_key)
+
+        if cached is not None:
+            attributes, categories = cached
+            self._attributes = attributes.copy()
+            self._categories = set(categories)
+            self.__name__ = self.__repr__()
+            return
+
+        with warnings.catch_warnings(record=True) as caught_warnings:
+            warnings.simplefilter("always")
+            self._initialize(argument, mass_numb=mass_numb, Z=Z)
+
+        for caught in caught_warnings:
+            warnings.warn(caught.message)
+
+        if not caught_warnings:
+            Particle._construction_cache[cache_key] = (
+                self._attributes.copy(),
+                frozenset(self._categories),
+            )
+
+    def _initialize(
+        self,
+        argument: Union[str, Integral],
+        mass_numb: Integral = None,
+        Z: Integral = None,
+    ):
+        """Parse the arguments and set the private attributes."""
+
         self._attributes = defaultdict(lambda: None)
         attributes = self._attributes
 
@@ -485,7 +551,7 @@ class Particle(AbstractParticle):
 
             if isotope:
 
-                Isotope = _Isotopes[isotope]
+                Isotope = _isotopes._Isotopes[isotope]
 
                 attributes["baryon number"] = Isotope["mass number"]
                 attributes["isotope mass"] = Isotope.get("mass", None)
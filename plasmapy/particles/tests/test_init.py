@@ -0,0 +1,33 @@
+"""Tests for the namespace of `plasmapy.particles`."""
+
+import inspect
+import plasmapy.particles
+
+
+def test_all_matches_namespace():
+    """
+    Test that the hardcoded `__all__` of `plasmapy.particles` stays
+    consistent with the public names in the module namespace, so that
+    drift is caught here rather than silently changing what
+    ``from plasmapy.particles import *`` provides.
+    """
+    listed = set(plasmapy.particles.__all__)
+    public_names = {
+        name for name in dir(plasmapy.particles) if not name.startswith("_")
+    }
+    # Sibling submodules (e.g. ``tests`` and ``data``) show up in the
+    # namespace whenever anything imports them, which depends on what
+    # else the test session has touched; ignore any module that is not
+    # part of the public listing.
+    public_names -= {
+        name
+        for name in public_names - listed
+        if inspect.ismodule(getattr(plasmapy.particles, name))
+    }
+    assert listed == public_names
+
+
+def test_all_is_sorted():
+    """Test that `__all__` is sorted so that it need not be sorted on import."""
+    listing = plasmapy.particles.__all__
+    assert list(listing) == sorted(listing)